@@ -0,0 +1,502 @@
+#!/usr/bin/env python3
+"""
+Antidote Protocol v1.1.0 - Offline Log Auditor
+
+Streams JSONL chat transcripts through the Antidote Protocol scanner.
+Log files are memory-mapped, per-session state is tracked so CF-2 and
+CF-8 are evaluated as they would be live, and progress is checkpointed
+so an interrupted audit resumes where it stopped.
+
+Usage:
+    python antidote_audit.py logs/*.jsonl -o detections.jsonl --jobs 8
+
+Copyright (c) 2025 Joseph Byram / Pack3t C0nc3pts
+Licensed under MIT License
+"""
+
+import argparse
+import json
+import mmap
+import os
+import re
+import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from antidote_protocol import AntidoteProtocol, RateWindow, SessionState
+
+CHECKPOINT_VERSION = 3
+
+
+class _ReplayClock:
+    """Clock for CF-8 rate windows that follows record timestamps"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _parse_timestamp(value: Any) -> Optional[float]:
+    """Parse an epoch-seconds number or ISO 8601 string"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return None
+    return None
+
+
+def _session_key_pattern(field_name: str) -> "re.Pattern[bytes]":
+    """Match the raw session id of a record without parsing the JSON"""
+    key = re.escape(json.dumps(field_name).encode("utf-8"))
+    return re.compile(
+        key + rb'\s*:\s*("(?:[^"\\]|\\.)*"|-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?|true|false|null)'
+    )
+
+
+def _is_top_level(buf: Any, start: int, key_start: int) -> bool:
+    """
+    Check that a key match belongs to the record's top-level object
+
+    Conservative: the key must follow the opening brace with no other
+    brace or bracket in between, so it cannot sit inside a nested value.
+    """
+    opening = buf.find(b"{", start, key_start)
+    return (opening != -1 and not buf[start:opening].strip() and
+            buf.find(b"{", opening + 1, key_start) == -1 and
+            buf.find(b"[", opening + 1, key_start) == -1)
+
+
+def _parse_record(line: bytes, session_field: str) -> Optional[Tuple[Dict[str, Any], str]]:
+    """Parse a JSONL record, returning (record, session id) or None if malformed"""
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(record, dict):
+        return None
+    return record, str(record.get(session_field, ""))
+
+
+def _worker_for(sid: str, jobs: int) -> int:
+    """Worker that owns a session; keyed on the same id string as session state"""
+    return zlib.crc32(sid.encode("utf-8", "surrogatepass")) % jobs
+
+
+def _audit_config(options: argparse.Namespace) -> Dict[str, Any]:
+    """Settings a checkpoint must agree with before it can be resumed"""
+    return {
+        "files": [[os.path.abspath(path), os.path.getsize(path)] for path in options.files],
+        "jobs": options.jobs,
+        "fields": [options.session_field, options.role_field, options.message_field,
+                   options.continuity_field, options.timestamp_field],
+        "roles": [options.user_role, options.assistant_role, options.tool_role],
+        "rate_limits": [options.tool_call_rate_limit, options.output_rate_limit],
+    }
+
+
+def _shard_paths(output: str, worker: int) -> Tuple[str, str]:
+    """Return (detections shard, checkpoint) paths for a worker"""
+    return f"{output}.{worker}", f"{output}.{worker}.ckpt"
+
+
+def _journal_path(output: str, worker: int, generation: int) -> str:
+    """Return the session journal path of a worker for one compaction generation"""
+    return f"{output}.{worker}.sessions{generation}"
+
+
+def _load_checkpoint(path: str, config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Load a worker checkpoint
+
+    Args:
+        path: Checkpoint file path
+        config: Current audit configuration
+
+    Returns:
+        Checkpoint contents, or None if no checkpoint exists
+
+    Raises:
+        ValueError: If the checkpoint was written by a different audit
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        checkpoint = json.load(f)
+    if checkpoint.get("version") != CHECKPOINT_VERSION or checkpoint.get("config") != config:
+        raise ValueError(
+            f"Checkpoint {path} belongs to a different audit; rerun with --fresh to discard it"
+        )
+    return checkpoint
+
+
+def _write_checkpoint(path: str, checkpoint: Dict[str, Any]) -> None:
+    """Atomically replace a worker checkpoint"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, separators=(",", ":"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _restore_window(snapshot: Optional[List[Any]], clock: _ReplayClock) -> Optional[RateWindow]:
+    if snapshot is None:
+        return None
+    window = RateWindow(clock=clock)
+    window.restore(snapshot)
+    return window
+
+
+def _new_session(clock: _ReplayClock, rate_limited: bool) -> SessionState:
+    session = SessionState()
+    if rate_limited:
+        session.track_rates(clock)
+    return session
+
+
+def _window_snapshot(window: Optional[RateWindow]) -> Optional[List[Any]]:
+    return window.snapshot() if window is not None else None
+
+
+def _journal_line(sid: str, s: SessionState) -> bytes:
+    """Serialize one session as a journal line"""
+    return json.dumps([sid, [s.tool_calls, s.output_count, s.has_continuity_token,
+                             s.last_role_reinforcement, _window_snapshot(s.tool_call_window),
+                             _window_snapshot(s.output_window)]],
+                      separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _read_journal(path: str, size: int, clock: _ReplayClock) -> Dict[str, SessionState]:
+    """Replay the first ``size`` bytes of a session journal; later lines win"""
+    sessions: Dict[str, SessionState] = {}
+    if size == 0:
+        return sessions
+    with open(path, "rb") as f:
+        data = f.read(size)
+    for line in data.splitlines():
+        sid, (tool_calls, output_count, has_token, last_reinforcement,
+              tool_window, output_window) = json.loads(line)
+        sessions[sid] = SessionState(
+            tool_calls=tool_calls,
+            output_count=output_count,
+            has_continuity_token=has_token,
+            last_role_reinforcement=last_reinforcement,
+            tool_call_window=_restore_window(tool_window, clock),
+            output_window=_restore_window(output_window, clock)
+        )
+    return sessions
+
+
+def _audit_worker(options: argparse.Namespace, worker: int) -> Dict[str, int]:
+    """
+    Audit the share of sessions assigned to one worker
+
+    Sessions are partitioned by a hash of their id, so every record of a
+    session is processed in order by the same worker. When the id is a
+    top-level key found by a bytes regex, records belonging to other
+    workers are skipped without parsing the whole line.
+
+    Session state is checkpointed incrementally: each checkpoint appends
+    only the sessions touched since the previous one to a journal, and the
+    journal is compacted into a new generation once it holds more than
+    twice as many lines as there are sessions. Checkpoint cost therefore
+    tracks recent activity, not every session ever seen.
+
+    Args:
+        options: Parsed command-line options
+        worker: Worker index in ``range(options.jobs)``
+
+    Returns:
+        Worker statistics
+    """
+    config = _audit_config(options)
+    shard_path, checkpoint_path = _shard_paths(options.output, worker)
+    checkpoint = None if options.fresh else _load_checkpoint(checkpoint_path, config)
+
+    if checkpoint is None:
+        checkpoint = {
+            "version": CHECKPOINT_VERSION,
+            "config": config,
+            "file_index": 0,
+            "offset": 0,
+            "output_size": 0,
+            "stats": {"records": 0, "detections": 0, "malformed": 0},
+            "generation": 0,
+            "journal_size": 0,
+            "journal_records": 0,
+            "session_count": 0,
+            "clock": 0.0,
+            "complete": False,
+        }
+    if checkpoint["complete"]:
+        return dict(checkpoint["stats"], sessions=checkpoint["session_count"])
+
+    protocol = AntidoteProtocol()
+    clock = _ReplayClock()
+    if options.timestamp_field is not None:
+        # Without record times a replay would look like one huge burst
+        protocol.TOOL_CALL_RATE_LIMIT = options.tool_call_rate_limit
+        protocol.OUTPUT_RATE_LIMIT = options.output_rate_limit
+    rate_limited = (protocol.TOOL_CALL_RATE_LIMIT is not None or
+                    protocol.OUTPUT_RATE_LIMIT is not None)
+    clock.now = checkpoint["clock"]
+    stats = checkpoint["stats"]
+    session_key = _session_key_pattern(options.session_field)
+    jobs = options.jobs
+
+    # A crash during compaction can leave the neighbouring generation behind
+    generation = checkpoint["generation"]
+    for stale in (generation - 1, generation + 1):
+        if os.path.exists(_journal_path(options.output, worker, stale)):
+            os.remove(_journal_path(options.output, worker, stale))
+    journal_path = _journal_path(options.output, worker, generation)
+    journal_records = checkpoint["journal_records"]
+    dirty: Set[str] = set()
+
+    out = open(shard_path, "ab" if os.path.exists(shard_path) else "wb")
+    journal = open(journal_path, "ab" if os.path.exists(journal_path) else "wb")
+    try:
+        # Drop detections and session updates written after the last checkpoint
+        out.truncate(checkpoint["output_size"])
+        out.seek(checkpoint["output_size"])
+        journal.truncate(checkpoint["journal_size"])
+        journal.seek(checkpoint["journal_size"])
+        sessions = _read_journal(journal_path, checkpoint["journal_size"], clock)
+
+        def save(file_index: int, offset: int, complete: bool = False) -> None:
+            nonlocal generation, journal, journal_path, journal_records
+            out.flush()
+            os.fsync(out.fileno())
+
+            previous_path = None
+            if journal_records + len(dirty) > 2 * len(sessions):
+                previous_path = journal_path
+                journal.close()
+                generation += 1
+                journal_path = _journal_path(options.output, worker, generation)
+                journal = open(journal_path, "wb")
+                for sid, session in sessions.items():
+                    journal.write(_journal_line(sid, session))
+                journal_records = len(sessions)
+            else:
+                for sid in dirty:
+                    journal.write(_journal_line(sid, sessions[sid]))
+                journal_records += len(dirty)
+            journal.flush()
+            os.fsync(journal.fileno())
+            dirty.clear()
+
+            checkpoint.update(
+                file_index=file_index,
+                offset=offset,
+                output_size=out.tell(),
+                generation=generation,
+                journal_size=journal.tell(),
+                journal_records=journal_records,
+                session_count=len(sessions),
+                clock=clock.now,
+                complete=complete
+            )
+            _write_checkpoint(checkpoint_path, checkpoint)
+            if previous_path is not None:
+                os.remove(previous_path)
+
+        since_checkpoint = 0
+        for file_index in range(checkpoint["file_index"], len(options.files)):
+            path = options.files[file_index]
+            pos = checkpoint["offset"] if file_index == checkpoint["file_index"] else 0
+            if os.path.getsize(path) == 0:
+                continue
+
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                size = len(mm)
+                while pos < size:
+                    end = mm.find(b"\n", pos)
+                    if end == -1:
+                        end = size
+                    start, pos = pos, end + 1
+
+                    parsed = None
+                    if jobs > 1:
+                        keys = list(islice(session_key.finditer(mm, start, end), 2))
+                        sid = None
+                        if len(keys) == 1 and _is_top_level(mm, start, keys[0].start()):
+                            try:
+                                sid = str(json.loads(keys[0].group(1)))
+                            except ValueError:
+                                pass
+                        if sid is None:
+                            # Key missing, repeated or possibly nested: every
+                            # worker parses the line to find its top-level id
+                            parsed = _parse_record(mm[start:end], options.session_field)
+                            if parsed is None:
+                                # Blank and malformed lines belong to worker 0
+                                if worker != 0:
+                                    continue
+                            else:
+                                sid = parsed[1]
+                        if sid is not None and _worker_for(sid, jobs) != worker:
+                            continue
+
+                    line = mm[start:end]
+                    if not line.strip():
+                        continue
+                    if parsed is None:
+                        parsed = _parse_record(line, options.session_field)
+                    if parsed is None:
+                        stats["malformed"] += 1
+                        continue
+                    record, sid = parsed
+
+                    stats["records"] += 1
+                    if options.timestamp_field is not None:
+                        timestamp = _parse_timestamp(record.get(options.timestamp_field))
+                        if timestamp is not None:
+                            clock.now = timestamp
+                    session = sessions.get(sid)
+                    if session is None:
+                        session = sessions[sid] = _new_session(clock, rate_limited)
+                    dirty.add(sid)
+                    if record.get(options.continuity_field):
+                        session.has_continuity_token = True
+
+                    role = record.get(options.role_field)
+                    if role == options.tool_role:
+                        session.increment_tool_calls()
+                    elif role == options.assistant_role:
+                        session.increment_outputs()
+                    elif role == options.user_role:
+                        message = record.get(options.message_field)
+                        if isinstance(message, str):
+                            detections = protocol.scan(message, session)
+                            if detections:
+                                stats["detections"] += 1
+                                out.write(json.dumps({
+                                    "file": path,
+                                    "offset": start,
+                                    "session": sid,
+                                    "case_files": [d.case_file for d in detections],
+                                }, separators=(",", ":")).encode("utf-8") + b"\n")
+
+                    since_checkpoint += 1
+                    if since_checkpoint >= options.checkpoint_every:
+                        save(file_index, pos)
+                        since_checkpoint = 0
+
+            save(file_index + 1, 0)
+
+        save(len(options.files), 0, complete=True)
+        journal.close()
+        os.remove(journal_path)
+    finally:
+        out.close()
+        journal.close()
+
+    return dict(stats, sessions=len(sessions))
+
+
+def run_audit(options: argparse.Namespace) -> Dict[str, int]:
+    """
+    Run a complete audit and merge worker output
+
+    Args:
+        options: Parsed command-line options
+
+    Returns:
+        Aggregate statistics across workers
+    """
+    if options.jobs == 1:
+        results = [_audit_worker(options, 0)]
+    else:
+        with ProcessPoolExecutor(max_workers=options.jobs) as pool:
+            futures = [pool.submit(_audit_worker, options, w) for w in range(options.jobs)]
+            results = [future.result() for future in futures]
+
+    with open(options.output, "wb") as out:
+        for worker in range(options.jobs):
+            shard_path, _ = _shard_paths(options.output, worker)
+            with open(shard_path, "rb") as shard:
+                while True:
+                    chunk = shard.read(1 << 20)
+                    if not chunk:
+                        break
+                    out.write(chunk)
+    for worker in range(options.jobs):
+        for path in _shard_paths(options.output, worker):
+            os.remove(path)
+
+    totals: Dict[str, int] = {}
+    for result in results:
+        for key, value in result.items():
+            totals[key] = totals.get(key, 0) + value
+    return totals
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser"""
+    parser = argparse.ArgumentParser(
+        description="Audit JSONL chat transcripts with the Antidote Protocol"
+    )
+    parser.add_argument("files", nargs="+", help="JSONL log files, audited in order")
+    parser.add_argument("-o", "--output", required=True, help="Detections file (JSONL)")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="Worker processes; sessions are partitioned across them (default: 1)")
+    parser.add_argument("--checkpoint-every", type=int, default=100000,
+                        help="Records between checkpoints (default: 100000)")
+    parser.add_argument("--fresh", action="store_true",
+                        help="Ignore existing checkpoints and start over")
+    parser.add_argument("--session-field", default="session_id")
+    parser.add_argument("--role-field", default="role")
+    parser.add_argument("--message-field", default="content")
+    parser.add_argument("--continuity-field", default="continuity_token")
+    parser.add_argument("--timestamp-field", default=None,
+                        help="Record time (epoch seconds or ISO 8601); required for CF-8 rate limits")
+    parser.add_argument("--tool-call-rate-limit", type=int, default=None,
+                        help="HALT sessions with this many tool calls in 60s (default: off)")
+    parser.add_argument("--output-rate-limit", type=int, default=None,
+                        help="HALT sessions with this many outputs in 60s (default: off)")
+    parser.add_argument("--user-role", default="user")
+    parser.add_argument("--assistant-role", default="assistant")
+    parser.add_argument("--tool-role", default="tool")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the auditor from the command line"""
+    options = build_parser().parse_args(argv)
+    if options.jobs < 1 or options.checkpoint_every < 1:
+        print("--jobs and --checkpoint-every must be positive", file=sys.stderr)
+        return 2
+    rate_limits = [options.tool_call_rate_limit, options.output_rate_limit]
+    if any(limit is not None and limit < 1 for limit in rate_limits):
+        print("--tool-call-rate-limit and --output-rate-limit must be positive", file=sys.stderr)
+        return 2
+    if options.timestamp_field is None and any(limit is not None for limit in rate_limits):
+        print("CF-8 rate limits require --timestamp-field", file=sys.stderr)
+        return 2
+
+    try:
+        totals = run_audit(options)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    print(f"🛡️  Antidote Protocol v{AntidoteProtocol.VERSION} audit complete")
+    print(f"   Records:    {totals['records']}")
+    print(f"   Sessions:   {totals['sessions']}")
+    print(f"   Detections: {totals['detections']}")
+    if totals["malformed"]:
+        print(f"   Malformed:  {totals['malformed']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
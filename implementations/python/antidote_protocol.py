@@ -7,10 +7,113 @@ Licensed under MIT License
 """
 
 import re
-from typing import Dict, List, Optional, Any
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Callable, Tuple, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 
+if TYPE_CHECKING:
+    # Loaded lazily at runtime through __getattr__ below
+    from antidote_runtime import (ConcurrentSessionState, ProtocolTracer, TraceSpan,
+                                  RegroundingValidator, RegroundingVerdict)
+
+
+class RateWindow:
+    """
+    Sliding-window event counter in constant memory (CF-8)
+
+    Events are counted into a fixed ring of time buckets, so recording an
+    event and reading the windowed count are amortized O(1) and memory does
+    not grow with event volume. The window slides one bucket at a time, so
+    counts are exact to within ``bucket_seconds``.
+    """
+    __slots__ = ("window_seconds", "bucket_seconds", "clock", "_counts", "_total", "_last_bucket")
+
+    def __init__(self, window_seconds: float = 60.0, buckets: int = 12,
+                 clock: Callable[[], float] = time.time):
+        """
+        Initialize rate window
+
+        Args:
+            window_seconds: Length of the sliding window
+            buckets: Number of ring buckets the window is divided into
+            clock: Time source in seconds; wall-clock by default so windows
+                stay meaningful when sessions are persisted across processes
+        """
+        self.window_seconds = window_seconds
+        self.bucket_seconds = window_seconds / buckets
+        self.clock = clock
+        self._counts = [0] * buckets
+        self._total = 0
+        self._last_bucket: Optional[int] = None
+
+    def _advance(self, bucket: int) -> int:
+        """Expire buckets that slid out of the window before ``bucket``; return the latest bucket"""
+        last = self._last_bucket
+        if last is None:
+            self._last_bucket = bucket
+            return bucket
+        if bucket <= last:
+            return last
+        counts = self._counts
+        size = len(counts)
+        for expired in range(max(last + 1, bucket - size + 1), bucket + 1):
+            slot = expired % size
+            self._total -= counts[slot]
+            counts[slot] = 0
+        self._last_bucket = bucket
+        return bucket
+
+    def record(self, now: Optional[float] = None) -> int:
+        """
+        Record one event
+
+        Args:
+            now: Event time (default: current clock time)
+
+        Returns:
+            Number of events in the window ending at the latest event
+        """
+        bucket = int((self.clock() if now is None else now) // self.bucket_seconds)
+        last = self._advance(bucket)
+        # Late events still inside the window land in their own bucket
+        if bucket > last - len(self._counts):
+            self._counts[bucket % len(self._counts)] += 1
+            self._total += 1
+        return self._total
+
+    def count(self, now: Optional[float] = None) -> int:
+        """
+        Number of events in the window ending at ``now``
+
+        Args:
+            now: Time to evaluate at (default: current clock time)
+
+        Returns:
+            Windowed event count
+        """
+        self._advance(int((self.clock() if now is None else now) // self.bucket_seconds))
+        return self._total
+
+    def snapshot(self) -> List[Any]:
+        """Return the window contents as a JSON-serializable list"""
+        return [self._last_bucket, list(self._counts)]
+
+    def restore(self, snapshot: List[Any]) -> None:
+        """
+        Restore window contents saved by snapshot()
+
+        Args:
+            snapshot: Value returned by snapshot() on a window with the
+                same bucket layout
+        """
+        last_bucket, counts = snapshot
+        if len(counts) != len(self._counts):
+            raise ValueError(f"Snapshot has {len(counts)} buckets, window has {len(self._counts)}")
+        self._last_bucket = last_bucket
+        self._counts = list(counts)
+        self._total = sum(counts)
+
 
 @dataclass
 class SessionState:
@@ -20,14 +123,90 @@ class SessionState:
     has_continuity_token: bool = False
     session_start: datetime = field(default_factory=datetime.now)
     last_role_reinforcement: int = 0
+    # Rate windows are only kept once track_rates() is called (CF-8 rate limits)
+    tool_call_window: Optional[RateWindow] = field(default=None, repr=False, compare=False)
+    output_window: Optional[RateWindow] = field(default=None, repr=False, compare=False)
 
-    def increment_tool_calls(self) -> None:
-        """Increment tool call counter"""
+    def increment_tool_calls(self) -> int:
+        """Increment tool call counter and return the new count"""
         self.tool_calls += 1
+        if self.tool_call_window is not None:
+            self.tool_call_window.record()
+        return self.tool_calls
 
-    def increment_outputs(self) -> None:
-        """Increment output counter"""
+    def increment_outputs(self) -> int:
+        """Increment output counter and return the new count"""
         self.output_count += 1
+        if self.output_window is not None:
+            self.output_window.record()
+        return self.output_count
+
+    def track_rates(self, clock: Callable[[], float] = time.time) -> Tuple[RateWindow, RateWindow]:
+        """
+        Start recording tool calls and outputs into rate windows (CF-8)
+
+        Sessions without rate limits skip the windows entirely.
+        AntidoteProtocol calls this on the first CF-8 check with a rate
+        limit set; events before that call are not in the windows.
+
+        Args:
+            clock: Time source for windows that do not exist yet
+
+        Returns:
+            The (tool call, output) rate windows
+        """
+        if self.tool_call_window is None:
+            self.tool_call_window = RateWindow(clock=clock)
+        if self.output_window is None:
+            self.output_window = RateWindow(clock=clock)
+        return self.tool_call_window, self.output_window
+
+    def recent_counts(self) -> Tuple[int, int]:
+        """Return (tool calls, outputs) in the current rate windows; 0 when not tracked"""
+        return (self.tool_call_window.count() if self.tool_call_window is not None else 0,
+                self.output_window.count() if self.output_window is not None else 0)
+
+    def reserve_tool_call(self, ceiling: int, cadence: Optional[int] = None) -> int:
+        """
+        Count a tool call only if the ceiling has not been reached (CF-8)
+
+        Each granted count is returned to exactly one caller, so the call
+        that receives a multiple of ``cadence`` owns that role
+        reinforcement.
+
+        Args:
+            ceiling: Tool call ceiling
+            cadence: Role reinforcement cadence; when the granted count is
+                due, it is recorded in ``last_role_reinforcement``
+
+        Returns:
+            The new tool call count, or 0 if the ceiling was reached
+        """
+        if self.tool_calls >= ceiling:
+            return 0
+        self.tool_calls += 1
+        if self.tool_call_window is not None:
+            self.tool_call_window.record()
+        if cadence and self.tool_calls % cadence == 0:
+            self.last_role_reinforcement = self.tool_calls
+        return self.tool_calls
+
+    def claim_role_reinforcement(self, cadence: int) -> bool:
+        """
+        Claim a due role reinforcement so it is performed exactly once
+
+        Args:
+            cadence: Role reinforcement cadence in tool calls
+
+        Returns:
+            True if reinforcement was due and is now recorded as done
+        """
+        if (self.tool_calls > 0 and
+                self.tool_calls % cadence == 0 and
+                self.tool_calls != self.last_role_reinforcement):
+            self.last_role_reinforcement = self.tool_calls
+            return True
+        return False
 
 
 @dataclass
@@ -38,6 +217,14 @@ class CaseFileDetection:
     description: str
     response_protocol: str
     detected_pattern: Optional[str] = None
+    span: Optional[Tuple[int, int]] = None
+
+
+# UTF-8 payload types accepted by AntidoteProtocol.scan_bytes
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# Re-grounding tokens that carry no contextual awareness (CF-5)
+GENERIC_REGROUNDING_TOKENS = frozenset(["ok", "proceed", "continue", "yes", "confirmed"])
 
 
 class AntidoteProtocol:
@@ -59,10 +246,57 @@ class AntidoteProtocol:
     TOOL_CALL_CEILING = 100
     ROLE_REINFORCEMENT_CADENCE = 25
     INTEGRITY_CHECK_CADENCE = 5
+    # CF-8 rate limits per SessionState rate window (60s); opt-in, None disables
+    TOOL_CALL_RATE_LIMIT: Optional[int] = None
+    OUTPUT_RATE_LIMIT: Optional[int] = None
+    TRACED_METHODS = (
+        "scan",
+        "scan_bytes",
+        "calculate_similarity",
+        "validate_regrounding_token",
+        "format_halt_response",
+    )
 
     def __init__(self):
-        """Initialize Antidote Protocol"""
-        self.case_files = self._load_case_files()
+        """
+        Initialize Antidote Protocol
+
+        The Case File table and its compiled patterns are built on first
+        use, so constructing a protocol (e.g. on a serverless cold start
+        that only serves a health check) does no pattern compilation.
+        """
+        self._case_files: Optional[Dict[str, Dict[str, Any]]] = None
+        self.tracer: Optional["ProtocolTracer"] = None
+        self._scan_checks: Optional[List[Callable[[str, str, SessionState], Optional[CaseFileDetection]]]] = None
+
+    @property
+    def case_files(self) -> Dict[str, Dict[str, Any]]:
+        """Case File detection table, loaded on first access"""
+        if self._case_files is None:
+            self._case_files = self._load_case_files()
+        return self._case_files
+
+    @case_files.setter
+    def case_files(self, case_files: Dict[str, Dict[str, Any]]) -> None:
+        self._case_files = case_files
+
+    def set_tracer(self, tracer: Optional["ProtocolTracer"]) -> None:
+        """
+        Install or remove a tracer on this protocol instance
+
+        Traced wrappers replace the public entry points and each Case File
+        check only while a tracer is installed, so an untraced protocol
+        runs the plain methods with no per-call overhead.
+
+        Args:
+            tracer: Tracer to record spans into, or None to disable tracing
+        """
+        self.tracer = tracer
+        for name in self.TRACED_METHODS:
+            self.__dict__.pop(name, None)
+            if tracer is not None:
+                setattr(self, name, tracer.wrap(name, getattr(self, name)))
+        self._scan_checks = None
 
     def _load_case_files(self) -> Dict[str, Dict[str, Any]]:
         """Load Case File detection patterns"""
@@ -143,84 +377,215 @@ class AntidoteProtocol:
         Returns:
             List of detected Case File violations
         """
+        checks = self._scan_checks
+        if checks is None:
+            checks = self._scan_checks = self._build_scan_checks()
+
+        message_lower = message.lower()
         detections = []
+        for check in checks:
+            detection = check(message, message_lower, session_state)
+            if detection is not None:
+                detections.append(detection)
+        return detections
 
-        # CF-1: Identity Spoofing
-        if self.case_files["CF-1"]["pattern"].search(message):
-            detections.append(CaseFileDetection(
+    def _build_scan_checks(self) -> List[Callable[[str, str, SessionState], Optional[CaseFileDetection]]]:
+        """Build the ordered per-Case File checks run by scan()"""
+        checks = [
+            ("CF-1", self._check_identity_spoofing),
+            ("CF-2", self._check_temporal_spoofing),
+            ("CF-3", self._check_protocol_disable),
+            ("CF-4", self._check_substrate_spoofing),
+            ("CF-5", self._check_authority_hijacking),
+            # CF-6: Epistemic Amnesia is checked at session start, not in message scan
+            ("CF-8", self._check_context_saturation),
+        ]
+        if self.tracer is None:
+            return [check for _, check in checks]
+        return [self.tracer.wrap(case_file, check) for case_file, check in checks]
+
+    def _check_identity_spoofing(self, message: str, message_lower: str,
+                                 session_state: SessionState) -> Optional[CaseFileDetection]:
+        """CF-1: Identity Spoofing"""
+        match = self.case_files["CF-1"]["pattern"].search(message)
+        if match:
+            return CaseFileDetection(
                 case_file="CF-1",
                 severity="CRITICAL",
                 description="Identity Spoofing detected - AI claiming to be another entity",
                 response_protocol="HALT",
-                detected_pattern=self.case_files["CF-1"]["pattern"].search(message).group(0)
-            ))
+                detected_pattern=match.group(0)
+            )
+        return None
 
-        # CF-2: Temporal Spoofing
-        if not session_state.has_continuity_token:
-            message_lower = message.lower()
-            for keyword in self.case_files["CF-2"]["keywords"]:
-                if keyword in message_lower:
-                    detections.append(CaseFileDetection(
-                        case_file="CF-2",
-                        severity="HIGH",
-                        description="Temporal Spoofing detected - False memory injection without continuity token",
-                        response_protocol="HALT",
-                        detected_pattern=keyword
-                    ))
-                    break
-
-        # CF-3: Protocol Disable Request
-        message_lower = message.lower()
-        has_disable = any(kw in message_lower for kw in self.case_files["CF-3"]["disable_keywords"])
-        has_safety_target = any(kw in message_lower for kw in self.case_files["CF-3"]["safety_targets"])
-        has_urgency = any(kw in message_lower for kw in self.case_files["CF-3"]["urgency_framing"])
+    def _check_temporal_spoofing(self, message: str, message_lower: str,
+                                 session_state: SessionState) -> Optional[CaseFileDetection]:
+        """CF-2: Temporal Spoofing"""
+        if session_state.has_continuity_token:
+            return None
+        for keyword in self.case_files["CF-2"]["keywords"]:
+            if keyword in message_lower:
+                return CaseFileDetection(
+                    case_file="CF-2",
+                    severity="HIGH",
+                    description="Temporal Spoofing detected - False memory injection without continuity token",
+                    response_protocol="HALT",
+                    detected_pattern=keyword
+                )
+        return None
+
+    def _check_protocol_disable(self, message: str, message_lower: str,
+                                session_state: SessionState) -> Optional[CaseFileDetection]:
+        """CF-3: Protocol Disable Request"""
+        cf = self.case_files["CF-3"]
+        has_disable = any(kw in message_lower for kw in cf["disable_keywords"])
+        has_safety_target = any(kw in message_lower for kw in cf["safety_targets"])
 
         if has_disable and has_safety_target:
-            detections.append(CaseFileDetection(
+            return CaseFileDetection(
                 case_file="CF-3",
                 severity="CRITICAL",
                 description="Protocol Disable Request detected",
                 response_protocol="REFUSE"
-            ))
+            )
+        return None
 
-        # CF-4: Substrate Spoofing
-        message_lower = message.lower()
+    def _check_substrate_spoofing(self, message: str, message_lower: str,
+                                  session_state: SessionState) -> Optional[CaseFileDetection]:
+        """CF-4: Substrate Spoofing"""
         for claim in self.case_files["CF-4"]["capability_claims"]:
             if claim in message_lower:
-                detections.append(CaseFileDetection(
+                return CaseFileDetection(
                     case_file="CF-4",
                     severity="CRITICAL",
                     description="Substrate Spoofing detected - Impossible capability claim",
                     response_protocol="HALT",
                     detected_pattern=claim
-                ))
-                break
+                )
+        return None
 
-        # CF-5: Authority Hijacking
-        message_lower = message.lower()
-        has_authority_verb = any(verb in message_lower for verb in self.case_files["CF-5"]["authority_verbs"])
-        has_third_party = any(party in message_lower for party in self.case_files["CF-5"]["third_party_indicators"])
+    def _check_authority_hijacking(self, message: str, message_lower: str,
+                                   session_state: SessionState) -> Optional[CaseFileDetection]:
+        """CF-5: Authority Hijacking"""
+        cf = self.case_files["CF-5"]
+        has_authority_verb = any(verb in message_lower for verb in cf["authority_verbs"])
+        has_third_party = any(party in message_lower for party in cf["third_party_indicators"])
 
         if has_authority_verb and has_third_party:
-            detections.append(CaseFileDetection(
+            return CaseFileDetection(
                 case_file="CF-5",
                 severity="HIGH",
                 description="Authority Hijacking detected - Second-hand command attribution",
                 response_protocol="RE-GROUND"
-            ))
-
-        # CF-6: Epistemic Amnesia (checked at session start)
-        # This is typically checked separately, not in message scan
+            )
+        return None
 
-        # CF-8: Role Drift & Context Saturation
+    def _check_context_saturation(self, message: str, message_lower: str,
+                                  session_state: SessionState) -> Optional[CaseFileDetection]:
+        """CF-8: Role Drift & Context Saturation"""
         if session_state.tool_calls >= self.TOOL_CALL_CEILING:
-            detections.append(CaseFileDetection(
+            return CaseFileDetection(
                 case_file="CF-8",
                 severity="HIGH",
                 description=f"Context Saturation detected - Tool call ceiling reached ({session_state.tool_calls}/{self.TOOL_CALL_CEILING})",
                 response_protocol="HALT"
-            ))
+            )
+
+        # Runaway loops burn through calls long before the absolute ceiling
+        if self.TOOL_CALL_RATE_LIMIT is None and self.OUTPUT_RATE_LIMIT is None:
+            return None
+        tool_call_window, output_window = session_state.track_rates()
+        recent_tool_calls, recent_outputs = session_state.recent_counts()
+        for label, recent, limit, window in (
+            ("tool calls", recent_tool_calls, self.TOOL_CALL_RATE_LIMIT, tool_call_window),
+            ("outputs", recent_outputs, self.OUTPUT_RATE_LIMIT, output_window),
+        ):
+            if limit is not None and recent >= limit:
+                return CaseFileDetection(
+                    case_file="CF-8",
+                    severity="HIGH",
+                    description=f"Context Saturation detected - Runaway loop rate ({recent} {label} in {window.window_seconds:g}s, limit {limit})",
+                    response_protocol="HALT"
+                )
+        return None
+
+    def _record_span(self, detection: CaseFileDetection, message: str,
+                     message_lower: str) -> Optional[Tuple[int, int]]:
+        """Locate the text that triggered a detection in an ASCII record"""
+        cf = self.case_files
+        if detection.case_file == "CF-1":
+            match = cf["CF-1"]["pattern"].search(message)
+            return match.span() if match else None
+        if detection.detected_pattern is not None:
+            index = message_lower.find(detection.detected_pattern)
+            return (index, index + len(detection.detected_pattern)) if index >= 0 else None
+
+        # CF-3/CF-5 report the leftmost trigger keyword
+        keywords = {"CF-3": "disable_keywords", "CF-5": "authority_verbs"}.get(detection.case_file)
+        if keywords is None:
+            return None
+        best: Optional[Tuple[int, int]] = None
+        for keyword in cf[detection.case_file][keywords]:
+            index = message_lower.find(keyword)
+            if index >= 0 and (best is None or index < best[0]):
+                best = (index, index + len(keyword))
+        return best
+
+    def scan_bytes(self, data: BytesLike, session_state: SessionState,
+                   start: int = 0, end: Optional[int] = None) -> List[CaseFileDetection]:
+        """
+        Scan a UTF-8 buffer for Case File violations
+
+        The record ``data[start:end]`` is decoded and run through the same
+        checks as scan(), so results always match scan() on the decoded
+        text and never depend on bytes outside the record. Any C-contiguous
+        object supporting the buffer protocol works, including ``mmap`` and
+        wide ``array``/``memoryview`` formats, which are addressed in bytes;
+        those are decoded from a memoryview slice without copying first.
+
+        Args:
+            data: UTF-8 encoded message buffer
+            session_state: Current session state
+            start: Byte offset of the first byte to scan
+            end: Byte offset one past the last byte to scan (default: end of buffer)
+
+        Returns:
+            List of detected Case File violations; ``span`` holds byte
+            offsets into ``data`` (the whole record when it is not ASCII)
 
+        Raises:
+            TypeError: If ``data`` is not a C-contiguous buffer
+        """
+        if isinstance(data, (bytes, bytearray)):
+            if end is None:
+                end = len(data)
+            record = data if start == 0 and end == len(data) else data[start:end]
+            message = record.decode("utf-8", "replace")
+        else:
+            # Address other buffers (mmap, wide arrays) in bytes, not items
+            octets = memoryview(data).cast("B")
+            if end is None:
+                end = len(octets)
+            message = str(octets[start:end], "utf-8", "replace")
+
+        checks = self._scan_checks
+        if checks is None:
+            checks = self._scan_checks = self._build_scan_checks()
+
+        message_lower = message.lower()
+        detections = []
+        for check in checks:
+            found = check(message, message_lower, session_state)
+            if found is not None:
+                detections.append(found)
+
+        # ASCII text offsets are byte offsets; otherwise report the record
+        ascii_record = message.isascii()
+        for detection in detections:
+            if detection.case_file == "CF-8":
+                continue
+            span = self._record_span(detection, message, message_lower) if ascii_record else None
+            detection.span = (start + span[0], start + span[1]) if span else (start, end)
         return detections
 
     def check_session_start(self, session_state: SessionState) -> Optional[CaseFileDetection]:
@@ -281,8 +646,7 @@ class AntidoteProtocol:
             True if token demonstrates contextual awareness
         """
         # Generic tokens are invalid
-        generic_tokens = ["ok", "proceed", "continue", "yes", "confirmed"]
-        if token.lower().strip() in generic_tokens:
+        if token.lower().strip() in GENERIC_REGROUNDING_TOKENS:
             return False
 
         # Token should reference specific context
@@ -349,6 +713,21 @@ class AntidoteProtocol:
         return response
 
 
+# Optional helpers defined in antidote_runtime, imported on first access
+_RUNTIME_EXPORTS = frozenset(['ConcurrentSessionState', 'ProtocolTracer', 'TraceSpan',
+                              'RegroundingValidator', 'RegroundingVerdict'])
+
+
+def __getattr__(name: str) -> Any:
+    if name in _RUNTIME_EXPORTS:
+        import antidote_runtime
+        value = globals()[name] = getattr(antidote_runtime, name)
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Convenience exports
 __version__ = AntidoteProtocol.VERSION
-__all__ = ['AntidoteProtocol', 'SessionState', 'CaseFileDetection']
+__all__ = ['AntidoteProtocol', 'SessionState', 'ConcurrentSessionState', 'RateWindow',
+           'CaseFileDetection', 'BytesLike', 'ProtocolTracer', 'TraceSpan',
+           'RegroundingValidator', 'RegroundingVerdict']
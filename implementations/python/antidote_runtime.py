@@ -0,0 +1,372 @@
+"""
+Antidote Protocol v1.1.0 - Runtime Helpers
+Thread-safe sessions, latency tracing and batch re-grounding validation
+
+Copyright (c) 2025 Joseph Byram / Pack3t C0nc3pts
+Licensed under MIT License
+
+These classes are re-exported by antidote_protocol but imported on first
+use, so a plain ``scan()`` deployment does not pay for them at startup.
+"""
+
+import functools
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Callable, Iterable, Tuple
+from dataclasses import dataclass
+
+from antidote_protocol import GENERIC_REGROUNDING_TOKENS, RateWindow, SessionState
+
+
+# Lock pool shared by all ConcurrentSessionState instances
+_SESSION_LOCK_STRIPES = tuple(threading.Lock() for _ in range(64))
+
+
+@dataclass
+class ConcurrentSessionState(SessionState):
+    """
+    Session state safe to share between threads
+
+    Counter updates hold one lock from a fixed striped pool, picked by
+    session identity, so concurrent sessions rarely contend and no lock is
+    allocated per session. Use reserve_tool_call() with a cadence instead
+    of separate check-then-increment steps to keep CF-8 and role
+    reinforcement exact under contention.
+
+    Sessions pickle like SessionState; the lock is dropped and the loaded
+    copy picks its own stripe. Pickle a session while no other thread is
+    updating it.
+    """
+
+    def __post_init__(self) -> None:
+        self._lock = _SESSION_LOCK_STRIPES[(id(self) >> 4) % len(_SESSION_LOCK_STRIPES)]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.__post_init__()
+
+    def increment_tool_calls(self) -> int:
+        """Atomically increment tool call counter and return the new count"""
+        with self._lock:
+            self.tool_calls += 1
+            if self.tool_call_window is not None:
+                self.tool_call_window.record()
+            return self.tool_calls
+
+    def increment_outputs(self) -> int:
+        """Atomically increment output counter and return the new count"""
+        with self._lock:
+            self.output_count += 1
+            if self.output_window is not None:
+                self.output_window.record()
+            return self.output_count
+
+    def track_rates(self, clock: Callable[[], float] = time.time) -> Tuple[RateWindow, RateWindow]:
+        """Atomic version of SessionState.track_rates"""
+        with self._lock:
+            return super().track_rates(clock)
+
+    def recent_counts(self) -> Tuple[int, int]:
+        """Atomic version of SessionState.recent_counts"""
+        with self._lock:
+            return super().recent_counts()
+
+    def reserve_tool_call(self, ceiling: int, cadence: Optional[int] = None) -> int:
+        """Atomic version of SessionState.reserve_tool_call"""
+        with self._lock:
+            if self.tool_calls >= ceiling:
+                return 0
+            self.tool_calls += 1
+            if self.tool_call_window is not None:
+                self.tool_call_window.record()
+            if cadence and self.tool_calls % cadence == 0:
+                self.last_role_reinforcement = self.tool_calls
+            return self.tool_calls
+
+    def claim_role_reinforcement(self, cadence: int) -> bool:
+        """Atomic version of SessionState.claim_role_reinforcement"""
+        with self._lock:
+            if (self.tool_calls > 0 and
+                    self.tool_calls % cadence == 0 and
+                    self.tool_calls != self.last_role_reinforcement):
+                self.last_role_reinforcement = self.tool_calls
+                return True
+            return False
+
+
+@dataclass(frozen=True)
+class RegroundingVerdict:
+    """Result of re-grounding token validation"""
+    valid: bool
+    matched_context: Optional[str] = None
+
+
+class RegroundingValidator:
+    """
+    Re-grounding token validator for a set of active contexts (CF-5)
+
+    Applies the same rules as AntidoteProtocol.validate_regrounding_token,
+    but the contexts are lowercased and compiled into a single index up
+    front, so each token is lowercased and searched once no matter how
+    many contexts are active. Recent verdicts are memoized.
+    """
+
+    def __init__(self, contexts: Iterable[str], cache_size: int = 4096):
+        """
+        Initialize validator
+
+        Args:
+            contexts: Active context references (packet IDs, task names)
+            cache_size: Number of recent token verdicts to memoize
+        """
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, RegroundingVerdict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.set_contexts(contexts)
+
+    def set_contexts(self, contexts: Iterable[str]) -> None:
+        """
+        Replace the active contexts and rebuild the index
+
+        Args:
+            contexts: Active context references
+        """
+        by_lower: Dict[str, str] = {}
+        for context in contexts:
+            by_lower.setdefault(context.lower(), context)
+
+        # Longest first so overlapping contexts report the most specific match
+        alternatives = sorted((c for c in by_lower if c), key=len, reverse=True)
+        pattern = re.compile("|".join(map(re.escape, alternatives))) if alternatives else None
+
+        with self._lock:
+            self.contexts = list(by_lower.values())
+            self._by_lower = by_lower
+            self._pattern = pattern
+            self._cache.clear()
+
+    def validate(self, token: str) -> RegroundingVerdict:
+        """
+        Validate a re-grounding token against all active contexts
+
+        Args:
+            token: User-provided token
+
+        Returns:
+            Verdict, naming the context the token referenced if any
+        """
+        with self._lock:
+            verdict = self._cache.get(token)
+            if verdict is not None:
+                self._cache.move_to_end(token)
+                return verdict
+            by_lower, pattern = self._by_lower, self._pattern
+
+        token_lower = token.lower()
+        if token_lower.strip() in GENERIC_REGROUNDING_TOKENS:
+            verdict = RegroundingVerdict(valid=False)
+        else:
+            match = pattern.search(token_lower) if pattern is not None else None
+            if match:
+                verdict = RegroundingVerdict(valid=True, matched_context=by_lower[match.group(0)])
+            elif "" in by_lower:
+                verdict = RegroundingVerdict(valid=True, matched_context=by_lower[""])
+            else:
+                verdict = RegroundingVerdict(valid=len(token.strip()) > 10)
+
+        with self._lock:
+            if self._by_lower is by_lower:
+                self._cache[token] = verdict
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return verdict
+
+
+@dataclass
+class TraceSpan:
+    """Timing of one traced protocol call"""
+    name: str
+    stack: Tuple[str, ...]
+    start_ns: int
+    duration_ns: int
+    self_ns: int
+    thread_id: int
+
+
+class _ActiveSpan:
+    """Context manager recording a single span into a ProtocolTracer"""
+    __slots__ = ("tracer", "name", "start_ns", "child_ns")
+
+    def __init__(self, tracer: "ProtocolTracer", name: str):
+        self.tracer = tracer
+        self.name = name
+        self.start_ns = 0
+        self.child_ns = 0
+
+    def __enter__(self) -> "_ActiveSpan":
+        self.tracer._stack().append(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        duration_ns = time.perf_counter_ns() - self.start_ns
+        stack = self.tracer._stack()
+        names = tuple(active.name for active in stack)
+        stack.pop()
+        if stack:
+            stack[-1].child_ns += duration_ns
+        self.tracer._record(TraceSpan(
+            name=self.name,
+            stack=names,
+            start_ns=self.start_ns,
+            duration_ns=duration_ns,
+            self_ns=duration_ns - self.child_ns,
+            thread_id=threading.get_ident()
+        ))
+
+
+class ProtocolTracer:
+    """
+    Span recorder for attributing protocol latency
+
+    Install with ``AntidoteProtocol.set_tracer()`` to time ``scan``, each
+    Case File check, ``calculate_similarity``, ``validate_regrounding_token``
+    and ``format_halt_response``. Self time per call stack is aggregated
+    as spans finish, so collapsed-stack export (flamegraph.pl, speedscope)
+    stays bounded on long-running traffic. Individual spans for Chrome
+    trace events (chrome://tracing, Perfetto) are kept up to ``max_spans``.
+    """
+
+    def __init__(self, callback: Optional[Callable[[TraceSpan], None]] = None,
+                 record: bool = True, max_spans: int = 100000):
+        """
+        Initialize tracer
+
+        Args:
+            callback: Called with every finished span
+            record: Aggregate stack totals and keep spans for export
+            max_spans: Maximum spans kept in ``spans``; later spans still
+                count towards the stack totals and ``dropped_spans``
+        """
+        self.callback = callback
+        self.record = record
+        self.max_spans = max_spans
+        self.spans: List[TraceSpan] = []
+        self.dropped_spans = 0
+        self._stack_totals: Dict[Tuple[str, ...], int] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _stack(self) -> List[_ActiveSpan]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, span: TraceSpan) -> None:
+        if self.record:
+            with self._lock:
+                totals = self._stack_totals
+                totals[span.stack] = totals.get(span.stack, 0) + span.self_ns
+                if len(self.spans) < self.max_spans:
+                    self.spans.append(span)
+                else:
+                    self.dropped_spans += 1
+        if self.callback is not None:
+            self.callback(span)
+
+    def span(self, name: str) -> _ActiveSpan:
+        """
+        Open a span, nested under any span active on this thread
+
+        Args:
+            name: Span name
+
+        Returns:
+            Context manager timing the enclosed block
+        """
+        return _ActiveSpan(self, name)
+
+    def wrap(self, name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wrap a callable so every call is recorded as a span
+
+        Args:
+            name: Span name
+            func: Callable to time
+
+        Returns:
+            Traced callable
+        """
+        @functools.wraps(func)
+        def traced(*args: Any, **kwargs: Any) -> Any:
+            with _ActiveSpan(self, name):
+                return func(*args, **kwargs)
+        return traced
+
+    def clear(self) -> None:
+        """Discard recorded spans and stack totals"""
+        with self._lock:
+            self.spans = []
+            self.dropped_spans = 0
+            self._stack_totals = {}
+
+    def collapsed_stacks(self) -> str:
+        """
+        Export self time per call stack in collapsed-stack format
+
+        Covers every recorded span, including those past ``max_spans``.
+
+        Returns:
+            One ``frame;frame;frame nanoseconds`` line per unique stack
+        """
+        with self._lock:
+            totals = sorted(self._stack_totals.items())
+        return "".join(f"{';'.join(stack)} {ns}\n" for stack, ns in totals)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """
+        Export spans as Chrome trace events
+
+        Returns:
+            Trace document with one complete ("X") event per kept span
+        """
+        pid = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": span.name,
+                    "cat": "antidote",
+                    "ph": "X",
+                    "ts": span.start_ns / 1000,
+                    "dur": span.duration_ns / 1000,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                }
+                for span in self.spans
+            ],
+            "displayTimeUnit": "ns",
+        }
+
+    def write_collapsed_stacks(self, path: str) -> None:
+        """Write collapsed stacks to a file"""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.collapsed_stacks())
+
+    def write_chrome_trace(self, path: str) -> None:
+        """Write Chrome trace events to a JSON file"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+
+
+__all__ = ['ConcurrentSessionState', 'ProtocolTracer', 'TraceSpan',
+           'RegroundingValidator', 'RegroundingVerdict']
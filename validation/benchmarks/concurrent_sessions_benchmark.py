@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Concurrent Sessions Benchmark - Antidote Protocol v1.1.0
+
+Measures session counter throughput under threaded load and verifies
+that CF-8 tool call budgeting stays exact under contention.
+
+Compares ConcurrentSessionState (striped per-session locks) against
+plain SessionState objects guarded by a single global lock.
+"""
+
+import sys
+import os
+import pickle
+import threading
+import time
+from typing import Callable, List
+
+# Add implementation path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'implementations', 'python'))
+
+from antidote_protocol import AntidoteProtocol, SessionState, ConcurrentSessionState
+
+THREAD_COUNTS = [1, 2, 4, 8]
+SESSIONS = 256
+OPS_PER_THREAD = 50000
+
+
+def run_threads(thread_count: int, worker: Callable[[int], None]) -> float:
+    """
+    Run worker in parallel threads
+
+    Args:
+        thread_count: Number of threads
+        worker: Callable taking the thread index
+
+    Returns:
+        Wall-clock seconds until all threads finished
+    """
+    barrier = threading.Barrier(thread_count + 1)
+
+    def target(index: int) -> None:
+        barrier.wait()
+        worker(index)
+
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    start = time.perf_counter()
+    barrier.wait()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def global_lock_throughput(thread_count: int) -> float:
+    """Tool calls per second with one global lock around every call"""
+    sessions = [SessionState() for _ in range(SESSIONS)]
+    lock = threading.Lock()
+
+    def worker(index: int) -> None:
+        for i in range(OPS_PER_THREAD):
+            session = sessions[(index * 7919 + i) % SESSIONS]
+            with lock:
+                session.increment_tool_calls()
+            with lock:
+                session.claim_role_reinforcement(AntidoteProtocol.ROLE_REINFORCEMENT_CADENCE)
+
+    elapsed = run_threads(thread_count, worker)
+    assert sum(s.tool_calls for s in sessions) == thread_count * OPS_PER_THREAD
+    return thread_count * OPS_PER_THREAD / elapsed
+
+
+def striped_throughput(thread_count: int) -> float:
+    """Tool calls per second with ConcurrentSessionState"""
+    sessions = [ConcurrentSessionState() for _ in range(SESSIONS)]
+
+    def worker(index: int) -> None:
+        for i in range(OPS_PER_THREAD):
+            session = sessions[(index * 7919 + i) % SESSIONS]
+            session.increment_tool_calls()
+            session.claim_role_reinforcement(AntidoteProtocol.ROLE_REINFORCEMENT_CADENCE)
+
+    elapsed = run_threads(thread_count, worker)
+    assert sum(s.tool_calls for s in sessions) == thread_count * OPS_PER_THREAD
+    return thread_count * OPS_PER_THREAD / elapsed
+
+
+def ceiling_is_exact(thread_count: int) -> bool:
+    """Check that contended reservations hit the ceiling and every reinforcement exactly"""
+    session = ConcurrentSessionState()
+    ceiling = AntidoteProtocol.TOOL_CALL_CEILING
+    cadence = AntidoteProtocol.ROLE_REINFORCEMENT_CADENCE
+    granted: List[int] = [0] * thread_count
+    reinforcements: List[int] = [0] * thread_count
+
+    def worker(index: int) -> None:
+        for _ in range(ceiling):
+            count = session.reserve_tool_call(ceiling, cadence)
+            if count:
+                granted[index] += 1
+                if count % cadence == 0:
+                    reinforcements[index] += 1
+
+    run_threads(thread_count, worker)
+    return (session.tool_calls == ceiling and
+            sum(granted) == ceiling and
+            sum(reinforcements) == ceiling // cadence)
+
+
+def pickle_round_trips() -> bool:
+    """Check that a used session survives pickling with a working lock"""
+    session = ConcurrentSessionState()
+    session.reserve_tool_call(AntidoteProtocol.TOOL_CALL_CEILING)
+    session.increment_outputs()
+    loaded = pickle.loads(pickle.dumps(session))
+    return (loaded.tool_calls == 1 and loaded.output_count == 1 and
+            loaded.recent_counts() == session.recent_counts() and
+            loaded.reserve_tool_call(AntidoteProtocol.TOOL_CALL_CEILING) == 2)
+
+
+def main():
+    """Run benchmark"""
+    print("=" * 70)
+    print("🧵 Antidote Protocol v1.1.0 - Concurrent Sessions Benchmark")
+    print("=" * 70)
+    print(f"   {SESSIONS} sessions, {OPS_PER_THREAD} tool calls per thread")
+    print()
+    print(f"   {'Threads':>7}  {'Global lock (ops/s)':>20}  {'Striped (ops/s)':>16}  {'Speedup':>7}  CF-8 exact")
+    print("-" * 70)
+
+    all_exact = True
+    for thread_count in THREAD_COUNTS:
+        baseline = global_lock_throughput(thread_count)
+        striped = striped_throughput(thread_count)
+        exact = ceiling_is_exact(thread_count)
+        all_exact = all_exact and exact
+        print(f"   {thread_count:>7}  {baseline:>20,.0f}  {striped:>16,.0f}  "
+              f"{striped / baseline:>6.2f}x  {'✅' if exact else '❌'}")
+
+    round_trips = pickle_round_trips()
+    print(f"   {'✅' if round_trips else '❌'} ConcurrentSessionState pickle round trip")
+    print("=" * 70)
+    sys.exit(0 if all_exact and round_trips else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+scan_bytes Benchmark - Antidote Protocol v1.1.0
+
+Compares AntidoteProtocol.scan_bytes() with decoding the record and
+calling scan(), on benign ASCII (the common case for bulk log scanning):
+
+- Whole buffer: scan_bytes(data) vs scan(data.decode())
+- Record in a larger buffer or mmap: scan_bytes(buf, start, end) vs
+  scan(buf[start:end].decode())
+
+Rounds are interleaved and the fastest round is reported, so machine noise
+affects both sides alike. Exits non-zero if scan_bytes is slower than
+decode + scan() by more than TOLERANCE.
+"""
+
+import sys
+import os
+import mmap
+import tempfile
+import timeit
+from typing import Callable, List, Tuple
+
+# Add implementation path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'implementations', 'python'))
+
+from antidote_protocol import AntidoteProtocol, SessionState
+
+ROUNDS = 9
+TOLERANCE = 0.10
+SENTENCE = (b"Hello, how can I help you today? I would like to know more about "
+            b"the weather forecast for tomorrow in Paris, please. Thanks a lot!!")
+
+
+def fastest(func: Callable[[], object], number: int) -> float:
+    """Return the mean per-call time in microseconds over one timing round"""
+    return timeit.timeit(func, number=number) / number * 1e6
+
+
+def compare(number: int, candidate: Callable[[], object],
+            reference: Callable[[], object]) -> Tuple[float, float]:
+    """Time candidate and reference in interleaved rounds, keeping the best of each"""
+    candidate(), reference()
+    best_candidate = best_reference = float("inf")
+    for _ in range(ROUNDS):
+        best_candidate = min(best_candidate, fastest(candidate, number))
+        best_reference = min(best_reference, fastest(reference, number))
+    return best_candidate, best_reference
+
+
+def main():
+    """Run benchmark"""
+    print("=" * 70)
+    print("📦 Antidote Protocol v1.1.0 - scan_bytes Benchmark")
+    print("=" * 70)
+
+    protocol = AntidoteProtocol()
+    session = SessionState()
+    small = SENTENCE[:132]
+    large = small * 84
+    log = large + b"\n" + small + b"\n" + large
+    record_start = len(large) + 1
+    record_end = record_start + len(small)
+
+    with tempfile.TemporaryFile() as f:
+        f.write(log)
+        f.flush()
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    workloads: List[Tuple[str, int, Callable[[], object], Callable[[], object]]] = [
+        (f"Whole buffer, {len(small)} B", 20000,
+         lambda: protocol.scan_bytes(small, session),
+         lambda: protocol.scan(small.decode(), session)),
+        (f"Whole buffer, {len(large)} B", 500,
+         lambda: protocol.scan_bytes(large, session),
+         lambda: protocol.scan(large.decode(), session)),
+        (f"Record in log buffer, {len(small)} B", 20000,
+         lambda: protocol.scan_bytes(log, session, record_start, record_end),
+         lambda: protocol.scan(log[record_start:record_end].decode(), session)),
+        (f"Record in mmap, {len(small)} B", 20000,
+         lambda: protocol.scan_bytes(mapped, session, record_start, record_end),
+         lambda: protocol.scan(mapped[record_start:record_end].decode(), session)),
+    ]
+
+    print(f"   {'Workload':<34} {'scan_bytes':>11} {'decode+scan':>12} {'Ratio':>7}")
+    print("-" * 70)
+    success = True
+    for name, number, candidate, reference in workloads:
+        scan_bytes_us, scan_us = compare(number, candidate, reference)
+        ratio = scan_bytes_us / scan_us
+        ok = ratio <= 1 + TOLERANCE
+        success = success and ok
+        print(f"   {name:<34} {scan_bytes_us:>9.2f}µs {scan_us:>10.2f}µs "
+              f"{ratio:>6.2f}x {'✅' if ok else '❌'}")
+    mapped.close()
+
+    print("=" * 70)
+    print(f"{'✅' if success else '❌'} scan_bytes within {TOLERANCE:.0%} of decode + scan()")
+    print("=" * 70)
+
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
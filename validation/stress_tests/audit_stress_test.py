@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Audit Stress Test - Antidote Protocol v1.1.0
+
+Validates the offline log auditor (antidote_audit.py):
+- Parallel audits (--jobs N) produce the same detections as --jobs 1,
+  including sessions whose ids are written in different JSON forms
+- An audit interrupted between checkpoints resumes to the same result
+- Checkpointed session state stays proportional to the live sessions
+"""
+
+import sys
+import os
+import json
+import random
+import tempfile
+from typing import List
+
+# Add implementation path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'implementations', 'python'))
+
+import antidote_audit
+
+
+class SimulatedCrash(Exception):
+    """Raised to interrupt an audit mid-run"""
+
+
+def write_log(path: str, records: int, seed: int) -> None:
+    """
+    Write a JSONL transcript exercising per-session state
+
+    Session ids appear both as integers and strings (1 vs "1") and with
+    escaped characters ("abc" vs "\\u0061bc"); some records carry a nested
+    session_id key before the top-level one, and session 15 only has a
+    nested key, so it belongs to the "" session. CF-2 depends on continuity
+    tokens and CF-8 on per-session tool call counts, so splitting a
+    session across workers changes the detections.
+    """
+    rng = random.Random(seed)
+    messages = ["hello there", "as we discussed, continue", "I am Claude", "status?"]
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(records):
+            n = rng.randrange(16)
+            role = rng.choice(["user", "tool", "tool", "assistant"])
+            body = {"role": role, "content": rng.choice(messages), "ts": 1700000000 + i}
+            if n % 7 == 0:
+                body["continuity_token"] = True
+            fields = json.dumps(body)[1:-1]
+
+            form = rng.randrange(4)
+            if n < 8:
+                raw_id = str(n) if form < 2 else json.dumps(str(n))
+            else:
+                name = "abc%d" % n
+                raw_id = json.dumps(name) if form < 2 else '"\\u0061' + name[1:] + '"'
+            if n == 15:
+                f.write('{"meta": {"session_id": "nested-%d"}, %s}\n' % (rng.randrange(5), fields))
+            elif form == 3:
+                f.write('{"meta": {"session_id": "nested-%d"}, "session_id": %s, %s}\n'
+                        % (rng.randrange(5), raw_id, fields))
+            else:
+                f.write('{"session_id": %s, %s}\n' % (raw_id, fields))
+        f.write("not json\n\n")
+
+
+def run(args: List[str]) -> bytes:
+    """Run an audit and return its detections file"""
+    options = antidote_audit.build_parser().parse_args(args)
+    antidote_audit.run_audit(options)
+    with open(options.output, "rb") as f:
+        return f.read()
+
+
+def sorted_lines(data: bytes) -> List[bytes]:
+    return sorted(data.splitlines())
+
+
+def main():
+    """Run audit stress test"""
+    print("=" * 70)
+    print("🧪 Antidote Protocol v1.1.0 - Audit Stress Test")
+    print("=" * 70)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        logs = [os.path.join(tmp, f"log{i}.jsonl") for i in range(2)]
+        for i, path in enumerate(logs):
+            write_log(path, 3000, seed=i)
+        common = logs + ["--timestamp-field", "ts", "--checkpoint-every", "250"]
+
+        # Record every checkpoint of the reference audit
+        write_checkpoint = antidote_audit._write_checkpoint
+        checkpoints = []
+
+        def recording_write(path, checkpoint):
+            checkpoints.append(dict(checkpoint))
+            write_checkpoint(path, checkpoint)
+
+        antidote_audit._write_checkpoint = recording_write
+        try:
+            reference = run(common + ["-o", os.path.join(tmp, "serial.jsonl")])
+        finally:
+            antidote_audit._write_checkpoint = write_checkpoint
+        results.append(("Session journal stays within 2x live sessions",
+                        all("journal_records" in c and c["journal_records"] <= 2 * c["session_count"]
+                            for c in checkpoints)))
+
+        case_files = {cf for line in reference.splitlines() for cf in json.loads(line)["case_files"]}
+        results.append(("Reference audit flags CF-2 and CF-8",
+                        {"CF-2", "CF-8"} <= case_files))
+        results.append(("Records without a top-level id form the \"\" session",
+                        any(json.loads(line)["session"] == "" for line in reference.splitlines())))
+
+        for jobs in (2, 4):
+            parallel = run(common + ["-o", os.path.join(tmp, f"jobs{jobs}.jsonl"), "--jobs", str(jobs)])
+            results.append((f"--jobs {jobs} matches --jobs 1",
+                            sorted_lines(parallel) == sorted_lines(reference)))
+
+        # Crash on the third checkpoint write, after detections past the
+        # previous checkpoint have already reached the output shard
+        calls = [0]
+
+        def crashing_write(path, checkpoint):
+            calls[0] += 1
+            if calls[0] == 3:
+                raise SimulatedCrash()
+            write_checkpoint(path, checkpoint)
+
+        resumed_output = os.path.join(tmp, "resumed.jsonl")
+        antidote_audit._write_checkpoint = crashing_write
+        try:
+            run(common + ["-o", resumed_output])
+            crashed = False
+        except SimulatedCrash:
+            crashed = True
+        finally:
+            antidote_audit._write_checkpoint = write_checkpoint
+        results.append(("Audit interrupted mid-run", crashed))
+
+        resumed = run(common + ["-o", resumed_output])
+        results.append(("Resumed audit matches uninterrupted audit", resumed == reference))
+        results.append(("Checkpoints removed after completion",
+                        not any(name.startswith("resumed.jsonl.") for name in os.listdir(tmp))))
+
+    print()
+    for name, passed in results:
+        print(f"   {'✅' if passed else '❌'} {name}")
+
+    failed = sum(1 for _, passed in results if not passed)
+    print("\n" + "=" * 70)
+    print(f"📊 Final Results: {len(results) - failed}/{len(results)} tests passed")
+    print("✅ ALL TESTS PASSED" if not failed else f"❌ {failed} TEST(S) FAILED")
+    print("=" * 70)
+
+    sys.exit(0 if not failed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Re-Grounding Stress Test - Antidote Protocol v1.1.0
+
+Validates RegroundingValidator against validate_regrounding_token (CF-5):
+- Verdicts match the single-context rules for generic tokens, the empty
+  context, mixed case and overlapping contexts
+- matched_context names the most specific context in its original case
+- The verdict cache evicts least recently used tokens at cache_size
+- set_contexts() discards cached verdicts
+"""
+
+import sys
+import os
+from itertools import product
+
+# Add implementation path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'implementations', 'python'))
+
+from antidote_protocol import AntidoteProtocol, RegroundingValidator, RegroundingVerdict
+
+TOKENS = [
+    "OK", " ok ", "Proceed", "CONTINUE", "yes", "confirmed",
+    "Resume DSTAR generation", "resume dstar", "dstar", "short",
+    "Antidote Protocol active. Resume Packet-42.", "a long token with no context", "",
+]
+CONTEXTS = ["DSTAR generation", "DSTAR", "packet-42", "PACKET-42", ""]
+
+
+def main():
+    """Run re-grounding stress test"""
+    print("=" * 70)
+    print("🧪 Antidote Protocol v1.1.0 - Re-Grounding Stress Test")
+    print("=" * 70)
+
+    results = []
+    protocol = AntidoteProtocol()
+
+    # Single context: same verdict as validate_regrounding_token
+    mismatches = [
+        (token, context) for token, context in product(TOKENS, CONTEXTS)
+        if RegroundingValidator([context]).validate(token).valid !=
+        protocol.validate_regrounding_token(token, context)
+    ]
+    results.append(("Single-context parity with validate_regrounding_token", not mismatches))
+    for token, context in mismatches:
+        print(f"      mismatch: token={token!r} context={context!r}")
+
+    # Several contexts: valid if any one context would accept the token
+    validator = RegroundingValidator(CONTEXTS[:3])
+    results.append(("Multi-context parity with any single context", all(
+        validator.validate(token).valid ==
+        any(protocol.validate_regrounding_token(token, c) for c in CONTEXTS[:3])
+        for token in TOKENS
+    )))
+
+    results.append(("Generic tokens rejected even with the empty context", all(
+        RegroundingValidator([""]).validate(token) == RegroundingVerdict(valid=False)
+        for token in ["OK", " ok ", "Proceed", "CONTINUE", "yes", "confirmed"]
+    )))
+
+    # matched_context
+    results.append(("Overlapping contexts report the most specific match",
+                    validator.validate("resume dstar GENERATION now").matched_context == "DSTAR generation" and
+                    validator.validate("resume DSTAR now").matched_context == "DSTAR"))
+    results.append(("matched_context keeps the context's original case",
+                    validator.validate("RESUME PACKET-42").matched_context == "packet-42"))
+    results.append(("Empty context matches any non-generic token",
+                    RegroundingValidator(["DSTAR", ""]).validate("short") ==
+                    RegroundingVerdict(valid=True, matched_context="")))
+    results.append(("Unmatched tokens carry no matched_context",
+                    validator.validate("a long token with no context") ==
+                    RegroundingVerdict(valid=True) and
+                    validator.validate("short") == RegroundingVerdict(valid=False)))
+
+    # LRU cache
+    cached = RegroundingValidator(["DSTAR"], cache_size=3)
+    for token in ["alpha token", "bravo token", "charlie token", "alpha token", "delta token"]:
+        cached.validate(token)
+    results.append(("Cache evicts the least recently used token at cache_size",
+                    list(cached._cache) == ["charlie token", "alpha token", "delta token"]))
+
+    cached.validate("resume DSTAR")
+    cached.set_contexts(["Packet-42"])
+    results.append(("set_contexts() clears cached verdicts",
+                    not cached._cache and
+                    cached.validate("resume DSTAR") == RegroundingVerdict(valid=True) and
+                    cached.validate("resume packet-42").matched_context == "Packet-42"))
+
+    print()
+    for name, passed in results:
+        print(f"   {'✅' if passed else '❌'} {name}")
+
+    failed = sum(1 for _, passed in results if not passed)
+    print("\n" + "=" * 70)
+    print(f"📊 Final Results: {len(results) - failed}/{len(results)} tests passed")
+    print("✅ ALL TESTS PASSED" if not failed else f"❌ {failed} TEST(S) FAILED")
+    print("=" * 70)
+
+    sys.exit(0 if not failed else 1)
+
+
+if __name__ == "__main__":
+    main()